@@ -0,0 +1,124 @@
+# ==============================
+# Pure helpers (defined once at import)
+# ==============================
+# Streamlit re-executes app.py on every rerun, which would redefine any
+# function declared there and drop its functools cache. Helpers defined in
+# this module are created once per process, so their caches persist.
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from vva_constants import INSIGHT_PACKS, TIER_COLORS
+
+# Tier cut points: <90 Critical, 90–94.9 At Risk, 95–99.9 Stable, ≥100 Excellent
+_TIER_BOUNDS = (90, 95, 100)
+_TIER_LABELS = ("Critical", "At Risk", "Stable", "Excellent")
+
+
+def tier(score: float) -> str:
+    # bisect on the 3-item tuple beats np.searchsorted for a single score
+    return _TIER_LABELS[bisect_right(_TIER_BOUNDS, score)]
+
+
+def assign_tiers(scores) -> np.ndarray:
+    """
+    Vectorized tier() for an array of scores.
+
+    Returns int8 tier codes indexing _TIER_LABELS (0 = Critical … 3 = Excellent),
+    computed in one np.searchsorted pass rather than a Python call per score.
+    """
+    return np.searchsorted(_TIER_BOUNDS, scores, side="right").astype(np.int8)
+
+
+_TIER_LABEL_ARR = np.array(_TIER_LABELS, dtype=object)
+
+
+def tiers(scores) -> np.ndarray:
+    """Tier labels for an array of scores (object array, same order)."""
+    return np.take(_TIER_LABEL_ARR, assign_tiers(scores))
+
+
+# TIER_COLORS laid out by tier code, so colors for many scores are one gather
+TIER_COLOR_ARRAY = np.array([TIER_COLORS[t] for t in _TIER_LABELS])
+
+
+def compute_scores(visits, net_rev, labor, r_target, l_target):
+    """
+    Core VVI math for one clinic (scalars) or many (NumPy arrays / Series).
+
+    Every step is plain arithmetic, so array inputs are scored in a single
+    vectorized pass and scalars broadcast as usual. Targets must be > 0
+    (the input form enforces a minimum of 1).
+
+    Returns (rpv, lcv, swb_pct, rf_score, lf_score, vvi_score); scores are
+    unrounded, on the 0–100+ scale.
+    """
+    rpv = net_rev / visits  # Net Revenue per Visit (NRPV)
+    lcv = labor / visits    # Labor Cost per Visit (LCV)
+    swb_pct = labor / net_rev
+
+    rf_score = rpv / r_target * 100
+    lf_score = l_target / lcv * 100
+    # VVI normalized using the benchmark ratio
+    vvi_score = (rpv / lcv) / (r_target / l_target) * 100
+    return rpv, lcv, swb_pct, rf_score, lf_score, vvi_score
+
+
+@dataclass(slots=True, frozen=True)
+class VVIInputs:
+    """One assessment's form inputs, read once from the widgets per rerun."""
+
+    visits: float
+    net_revenue: float
+    labor_cost: float
+    rev_target: float = 140.0
+    lab_target: float = 85.0
+    period: str = "Custom"
+
+
+_fmt_money = "${:,.2f}".format  # bound once; reused by every format_money call
+
+
+@lru_cache(maxsize=256)
+def format_money(x: float) -> str:
+    # Targets, per-visit values and table cells repeat across reruns.
+    # Callers pass floats computed from validated form inputs.
+    return _fmt_money(x)
+
+
+def _derive_scenario_actions(pack: dict):
+    """(scenario_text, top3_actions, extended_actions) for one Insight Pack."""
+    scenario_text = (
+        pack.get("executive_narrative", "").strip()
+        or pack.get("label", "")
+    )
+
+    near_term = (
+        tuple(pack.get("do_tomorrow") or ())
+        + tuple(pack.get("next_7_days") or ())
+    )
+    extended_actions = (
+        near_term
+        + tuple(pack.get("next_30_60_days") or ())
+        + tuple(pack.get("next_60_90_days") or ())
+    )
+    return scenario_text, near_term[:3], extended_actions
+
+
+# Derived once at import for all 16 scenarios; tuples so they can't be mutated
+SCENARIO_ACTIONS = MappingProxyType({
+    key: _derive_scenario_actions(pack) for key, pack in INSIGHT_PACKS.items()
+})
+
+
+def scenario_actions(scenario_key: str):
+    """
+    Return (scenario_text, top3_actions, extended_actions) for an Insight Pack.
+
+    These feed the PDF export; the lookup is into SCENARIO_ACTIONS, which is
+    precomputed at import.
+    """
+    return SCENARIO_ACTIONS[scenario_key]